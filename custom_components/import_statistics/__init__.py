@@ -53,9 +53,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:  # pylint: disable=u
             _LOGGER.debug("Statistics:")
             _LOGGER.debug(statistics)
 
+            # Existence of the entities has already been checked in check_all_entities_exists
             if metadata["source"] == "recorder":
-                if check_entity_exists(hass, metadata["statistic_id"]):
-                    async_import_statistics(hass, metadata, statistics)
+                async_import_statistics(hass, metadata, statistics)
             else:
                 async_add_external_statistics(hass, metadata, statistics)
 
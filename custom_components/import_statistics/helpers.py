@@ -71,15 +71,15 @@ def get_mean_stat(row: pd.Series, timezone: zoneinfo.ZoneInfo, datetime_format:
         dict: A dictionary containing the extracted mean statistics.
 
     """
+    start = get_full_hour(row["start"], datetime_format)
     if (
-        is_full_hour(row["start"], datetime_format)
-        and is_valid_float(row["min"])
+        is_valid_float(row["min"])
         and is_valid_float(row["max"])
         and is_valid_float(row["mean"])
         and min_max_mean_are_valid(row["min"], row["max"], row["mean"])
     ):
         return {
-            "start": dt.datetime.strptime(row["start"], datetime_format).replace(tzinfo=timezone),
+            "start": start.replace(tzinfo=timezone),
             "min": row["min"],
             "max": row["max"],
             "mean": row["mean"],
@@ -102,17 +102,18 @@ def get_sum_stat(row: pd.Series, timezone: zoneinfo.ZoneInfo, datetime_format: s
         dict: A dictionary containing the extracted sum statistics.
 
     """
-    if is_full_hour(row["start"], datetime_format) and is_valid_float(row["sum"]):
+    start = get_full_hour(row["start"], datetime_format)
+    if is_valid_float(row["sum"]):
         if "state" in row.index:
             if is_valid_float(row["state"]):
                 return {
-                    "start": dt.datetime.strptime(row["start"], datetime_format).replace(tzinfo=timezone),
+                    "start": start.replace(tzinfo=timezone),
                     "sum": row["sum"],
                     "state": row["state"],
                 }
         else:
             return {
-                "start": dt.datetime.strptime(row["start"], datetime_format).replace(tzinfo=timezone),
+                "start": start.replace(tzinfo=timezone),
                 "sum": row["sum"],
             }
 
@@ -136,18 +137,44 @@ def is_full_hour(timestamp_str: str, datetime_format: str = DATETIME_DEFAULT_FOR
     ------
         HomeAssistantError: If the timestamp is not a full hour.
 
+    """
+    get_full_hour(timestamp_str, datetime_format)
+    return True
+
+
+def get_full_hour(timestamp_str: str, datetime_format: str = DATETIME_DEFAULT_FORMAT) -> dt.datetime:
+    """
+    Parse the given timestamp and check if it is a full hour.
+
+    The timestamp is parsed only once, so that the caller can reuse the result instead of parsing it again.
+
+    Args:
+    ----
+        timestamp_str (str): The timestamp string
+        datetime_format (str): The format of the provided timestamp_str, e.g. "%d.%m.%Y %H:%M"
+
+    Returns:
+    -------
+        datetime: The parsed timestamp, without timezone.
+
+    Raises:
+    ------
+        HomeAssistantError: If the timestamp cannot be parsed or is not a full hour.
+
     """
     try:
-        dt1 = dt.datetime.strptime(timestamp_str, datetime_format).astimezone(dt.UTC)
+        # The timezone is added by the caller
+        timestamp = dt.datetime.strptime(timestamp_str, datetime_format)  # noqa: DTZ007
     except ValueError as exc:
         msg = f"Invalid timestamp: {timestamp_str}. The timestamp must be in the format '{datetime_format}'."
         raise HomeAssistantError(msg) from exc
 
+    dt1 = timestamp.astimezone(dt.UTC)
     if dt1.minute != 0 or dt1.second != 0:
         msg = f"Invalid timestamp: {timestamp_str}. The timestamp must be a full hour."
         raise HomeAssistantError(msg)
 
-    return True
+    return timestamp
 
 
 def is_valid_float(value: str) -> bool:
@@ -1,11 +1,13 @@
 """Unit tests for functions is_full_hour, get_mean_stat and get_sum_stat."""
 
+import datetime as dt
 import re
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.import_statistics.helpers import (
+    get_full_hour,
     is_full_hour,
     is_valid_float,
     min_max_mean_are_valid,
@@ -94,6 +96,26 @@ def test_is_full_hour_invalid_datetime_format() -> None:
         is_full_hour(timestamp_str, datetime_format)
 
 
+def test_get_full_hour_returns_parsed_timestamp() -> None:
+    """Test the get_full_hour function returns the parsed timestamp without timezone."""
+    timestamp_str = "2022-12-27 12:00"
+    datetime_format = "%Y-%m-%d %H:%M"
+
+    result = get_full_hour(timestamp_str, datetime_format)
+    assert result == dt.datetime(2022, 12, 27, 12, 0)  # noqa: DTZ001
+
+
+def test_get_full_hour_invalid_minute() -> None:
+    """Test the get_full_hour function with an invalid timestamp due to non-zero minute."""
+    timestamp_str = "01.01.2022 12:30"
+
+    with pytest.raises(
+        HomeAssistantError,
+        match=re.escape(f"Invalid timestamp: {timestamp_str}. The timestamp must be a full hour."),
+    ):
+        get_full_hour(timestamp_str)
+
+
 def test_min_max_mean_are_valid_valid_values() -> None:
     """Test the min_max_mean_are_valid function with valid values."""
     min_value = 0.0